@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# make the app package under src/ importable for the tests, once per test session
+_src_path = str(Path(__file__).resolve().parent / 'src')
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CelestialObject:
     name: str
     object_type: str
@@ -10,13 +10,13 @@ class CelestialObject:
     altitude: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CelestialObjectScore:
     score: float
     normalized_score: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CelestialObjectData:
     name: str
     object_type: str
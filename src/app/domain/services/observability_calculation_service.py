@@ -1,27 +1,91 @@
 import math
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
 
 from app.domain.model.celestial_object import CelestialObjectScore
 from app.domain.services.strategies import *
 
+_inverse_ln_1_5 = 1 / math.log(1.5)  # log base 1.5 as a single multiplication instead of two logs and a division
+_max_transformed_score = 2  # Adjust based on observed transformed score range
+_normalized_score_scale = 25  # Rescaling to a 0-25 scale
+
+# strategies are stateless, so a single instance of each is shared by all scoring calls
+_solar_system_scoring_strategy = SolarSystemScoringStrategy()
+_deep_sky_scoring_strategy = DeepSkyScoringStrategy()
+_large_faint_object_scoring_strategy = LargeFaintObjectScoringStrategy()
+_solar_system_object_types = frozenset(['Planet', 'Moon', 'Sun'])
+
+
+# the two transformations applied by _normalize_score(s), written once for both floats and arrays
+def _transform_high_scores(scores: FloatOrArray) -> FloatOrArray:
+    return np.log10(scores + 1) ** 2  # More aggressive transformation for higher scores
+
+
+def _transform_low_scores(scores: FloatOrArray) -> FloatOrArray:
+    return np.log(scores + 1) * _inverse_ln_1_5  # Less aggressive transformation for lower scores
+
+
+def _rescale_transformed_scores(transformed_scores: FloatOrArray) -> FloatOrArray:
+    return (transformed_scores / _max_transformed_score) * _normalized_score_scale
+
+
+# shared by the single and batch scoring paths; an unknown (NaN) altitude is never above the horizon
+def _is_above_horizon(altitude: float) -> bool:
+    return altitude > horizon_altitude
+
 
 class ObservabilityCalculationService:
 
     def calculate_observability_score(self, celestial_object: CelestialObject) -> CelestialObjectScore:
-        strategy = self._determine_scoring_strategy(celestial_object)
+        return self._calculate_observability_score(celestial_object)
+
+    # scoring is a pure function of the (frozen, hashable) celestial object, so identical objects are only scored once
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_observability_score(celestial_object: CelestialObject) -> CelestialObjectScore:
+        strategy = ObservabilityCalculationService._determine_scoring_strategy(celestial_object)
+        if not _is_above_horizon(celestial_object.altitude):
+            return CelestialObjectScore(0.0, 0.0)
+
         base_score = strategy.calculate_score(celestial_object)
         altitude_adjusted_score = base_score  # adjust_for_altitude(base_score, celestial_object.altitude)
 
-        return CelestialObjectScore(altitude_adjusted_score, self._normalize_score(altitude_adjusted_score))
+        return CelestialObjectScore(altitude_adjusted_score, ObservabilityCalculationService._normalize_score(altitude_adjusted_score))
+
+    def calculate_observability_scores(self, celestial_objects: list[CelestialObject]) -> list[CelestialObjectScore]:
+        count = len(celestial_objects)
+        magnitudes = np.fromiter((celestial_object.magnitude for celestial_object in celestial_objects), dtype=float, count=count)
+        sizes = np.fromiter((celestial_object.size for celestial_object in celestial_objects), dtype=float, count=count)
+
+        # score each group of objects sharing a strategy in one pass over the arrays
+        indices_per_strategy: dict[IObservabilityScoringStrategy, list[int]] = defaultdict(list)
+        for i, celestial_object in enumerate(celestial_objects):
+            strategy = self._determine_scoring_strategy(celestial_object)
+            if _is_above_horizon(celestial_object.altitude):
+                indices_per_strategy[strategy].append(i)
+
+        scores = np.zeros(count)  # objects below the horizon keep a zero score
+        for strategy, indices in indices_per_strategy.items():
+            scores[indices] = strategy.calculate_scores(magnitudes[indices], sizes[indices])
+
+        normalized_scores = self._normalize_scores(scores)
+        return [CelestialObjectScore(float(score), float(normalized_score)) for score, normalized_score in zip(scores, normalized_scores)]
+
+    # raises ValueError for objects that cannot be scored, so callers can reject them before scoring a whole batch
+    def verify_scorable(self, celestial_object: CelestialObject) -> None:
+        self._determine_scoring_strategy(celestial_object)
 
     @staticmethod
     def _determine_scoring_strategy(celestial_object: CelestialObject) -> IObservabilityScoringStrategy:
-        if celestial_object.object_type in ['Planet', 'Moon', 'Sun']:
-            return SolarSystemScoringStrategy()
+        if celestial_object.object_type in _solar_system_object_types:
+            return _solar_system_scoring_strategy
         elif celestial_object.object_type == 'DeepSky':
             if celestial_object.size > large_object_size_threshold_in_arcminutes:
-                return LargeFaintObjectScoringStrategy()
+                return _large_faint_object_scoring_strategy
             else:
-                return DeepSkyScoringStrategy()
+                return _deep_sky_scoring_strategy
         else:
             raise ValueError(f'Unknown celestial object type: {celestial_object.object_type}')
 
@@ -34,12 +98,15 @@ class ObservabilityCalculationService:
         return score * altitude_factor
 
     @staticmethod
-    def _normalize_score(score) -> float:
+    def _normalize_score(score: float) -> float:
         if score > 10:
-            transformed_score = math.log10(score + 1) ** 2  # More aggressive transformation for higher scores
+            transformed_score = _transform_high_scores(score)
         else:
-            transformed_score = math.log(score + 1, 1.5)  # Less aggressive transformation for lower scores
+            transformed_score = _transform_low_scores(score)
 
-        max_transformed_score = 2  # Adjust based on observed transformed score range
-        rescaled_score = (transformed_score / max_transformed_score) * 25  # Rescaling to a 0-25 scale
-        return rescaled_score
+        return float(_rescale_transformed_scores(transformed_score))
+
+    @staticmethod
+    def _normalize_scores(scores: np.ndarray) -> np.ndarray:
+        transformed_scores = np.where(scores > 10, _transform_high_scores(scores), _transform_low_scores(scores))
+        return _rescale_transformed_scores(transformed_scores)
@@ -1,57 +1,81 @@
+import math
 from abc import abstractmethod, ABC
 
+import numpy as np
+
 from app.utils.constants import *
 
 
+_negative_0_4_ln_10 = -0.4 * math.log(10)  # 10 ** (-0.4 * m) == exp(-0.4 * ln(10) * m)
+
+# the scoring formulas only use NumPy ufuncs, so they accept a single value as well as an array of values
+FloatOrArray = float | np.ndarray
+
+
+# Pogson's law: relative flux of an apparent magnitude
+def magnitudes_to_fluxes(magnitudes: FloatOrArray) -> FloatOrArray:
+    return np.exp(_negative_0_4_ln_10 * magnitudes)
+
+
+# derived with the same flux formula the strategies use, so the reference objects normalize exactly to max_observable_score
+sun_solar_magnitude_score = float(magnitudes_to_fluxes(best_observable_object.magnitude))
+sirius_deepsky_magnitude_score = float(magnitudes_to_fluxes(brightest_deepsky_object.magnitude + deepsky_magnitude_offset))
+
+
 class IObservabilityScoringStrategy(ABC):
-    @abstractmethod
+    # each strategy's formula only exists in calculate_scores, which is called here with plain floats
     def calculate_score(self, celestial_object) -> float:
+        return float(self.calculate_scores(celestial_object.magnitude, celestial_object.size))
+
+    # scores one or many objects at once (element-wise over the given arrays)
+    @abstractmethod
+    def calculate_scores(self, magnitudes: FloatOrArray, sizes: FloatOrArray) -> FloatOrArray:
         pass
 
 
 class SolarSystemScoringStrategy(IObservabilityScoringStrategy):
 
-    def calculate_score(self, celestial_object):
-        magnitude_score = self._normalize_magnitude(10 ** (-0.4 * celestial_object.magnitude))
-        size_score = self._normalize_size(celestial_object.size)
-        return (magnitude_score + size_score) / 2
+    def calculate_scores(self, magnitudes: FloatOrArray, sizes: FloatOrArray) -> FloatOrArray:
+        magnitude_scores = self._normalize_magnitude(magnitudes_to_fluxes(magnitudes))
+        size_scores = self._normalize_size(sizes)
+        return (magnitude_scores + size_scores) / 2
 
     # normalize to 0-10 scale
     @staticmethod
-    def _normalize_magnitude(score) -> float:
+    def _normalize_magnitude(score: FloatOrArray) -> FloatOrArray:
         return (score / sun_solar_magnitude_score) * max_observable_score
 
     @staticmethod
-    def _normalize_size(score) -> float:
+    def _normalize_size(score: FloatOrArray) -> FloatOrArray:
         return (score / max_solar_size) * max_observable_score
 
 
 class DeepSkyScoringStrategy(IObservabilityScoringStrategy):
 
-    def calculate_score(self, celestial_object):
-        magnitude_score = self._normalize_magnitude(10 ** (-0.4 * (celestial_object.magnitude + 12)))
-        size_score = self._normalize_size(celestial_object.size)
-        return (magnitude_score + size_score) / 2
+    def calculate_scores(self, magnitudes: FloatOrArray, sizes: FloatOrArray) -> FloatOrArray:
+        magnitude_scores = self._normalize_magnitude(magnitudes_to_fluxes(magnitudes + deepsky_magnitude_offset))
+        size_scores = self._normalize_size(sizes)
+        return (magnitude_scores + size_scores) / 2
 
     @staticmethod
-    def _normalize_magnitude(score) -> float:
+    def _normalize_magnitude(score: FloatOrArray) -> FloatOrArray:
         return (score / sirius_deepsky_magnitude_score) * max_observable_score
 
     @staticmethod
-    def _normalize_size(score) -> float:
+    def _normalize_size(score: FloatOrArray) -> FloatOrArray:
         return (score / max_deepsky_size) * max_observable_score
 
 
 class LargeFaintObjectScoringStrategy(IObservabilityScoringStrategy):
-    def calculate_score(self, celestial_object):
+    def calculate_scores(self, magnitudes: FloatOrArray, sizes: FloatOrArray) -> FloatOrArray:
         # Adjust the magnitude score to increase with faintness
-        magnitude_score = max(0, (celestial_object.magnitude - faint_object_magnitude_baseline))
+        magnitude_scores = np.maximum(0, magnitudes - faint_object_magnitude_baseline)
 
         # Adjust the size score to increase with size
-        size_score = min(celestial_object.size / max_deepsky_size, 1)  # Cap the size score at 1
+        size_scores = np.minimum(sizes / max_deepsky_size, 1)  # Cap the size score at 1
 
         # Combine scores
-        combined_score = (0.4 * magnitude_score) + (0.6 * size_score)
+        combined_scores = (0.4 * magnitude_scores) + (0.6 * size_scores)
 
         # Normalize the combined score to fit within the desired range (e.g., 0-25)
-        return min(combined_score, max_observable_score) / 10
+        return np.minimum(combined_scores, max_observable_score) / 10
@@ -1,9 +1,14 @@
+import logging
+import math
+
 import pandas as pd
 
 # Assuming the CelestialObject class and observability_calculation_service are defined elsewhere
 from app.domain.model.celestial_object import CelestialObject, CelestialsList, CelestialObjectData
 from app.domain.services.observability_calculation_service import ObservabilityCalculationService
 
+logger = logging.getLogger(__name__)
+
 observability_calculation_service = ObservabilityCalculationService()
 
 
@@ -34,26 +39,32 @@ class AstroPlannerExcelImporter:
         # Normalize data, e.g., converting sizes from arcseconds to arcminutes if necessary
         filtered_df['Size'] = filtered_df['Size'].astype(str).str.replace(',', '.').apply(self.normalize_size)
 
-        # Calculate observability scores and store results
-        celestial_objects_data: CelestialsList = []
+        celestial_objects: list[CelestialObject] = []
         for _, row in filtered_df.iterrows():
             try:
                 celestial_object = self.read_row_as_celestial_object(row)
-                print('processing celestial object:', celestial_object)
-                celestial_object_data: CelestialObjectData = CelestialObjectData(
-                    name=celestial_object.name,
-                    object_type=celestial_object.object_type,
-                    magnitude=celestial_object.magnitude,
-                    size=celestial_object.size,
-                    altitude=celestial_object.altitude,
-                    observability_score=observability_calculation_service.calculate_observability_score(celestial_object)
-                )
-                celestial_objects_data.append(celestial_object_data)
+                observability_calculation_service.verify_scorable(celestial_object)
+                logger.debug('processing celestial object: %s', celestial_object)
+                celestial_objects.append(celestial_object)
             except ValueError as e:
-                # Handle the case where conversion to float fails
-                print(f"Warning: Could not convert data for row: {row}. Error: {e}")
+                # Skip rows that fail float conversion or have an object type that can't be scored
+                logger.warning('Skipping row %s: %s', row['ID'], e)
                 continue
 
+        # Calculate observability scores for all objects in one batch and store results
+        observability_scores = observability_calculation_service.calculate_observability_scores(celestial_objects)
+        celestial_objects_data: CelestialsList = [
+            CelestialObjectData(
+                name=celestial_object.name,
+                object_type=celestial_object.object_type,
+                magnitude=celestial_object.magnitude,
+                size=celestial_object.size,
+                altitude=celestial_object.altitude,
+                observability_score=observability_score
+            )
+            for celestial_object, observability_score in zip(celestial_objects, observability_scores)
+        ]
+
         return celestial_objects_data
 
     @staticmethod
@@ -62,13 +73,21 @@ class AstroPlannerExcelImporter:
             return CelestialObject(
                 name=(row['ID']),
                 object_type=(row['Type']),
-                magnitude=(float(row['Mag'])),
-                size=(float(row['Size'])),
-                altitude=(float(row['Altitude']))
+                magnitude=AstroPlannerExcelImporter.read_number(row, 'Mag'),
+                size=AstroPlannerExcelImporter.read_number(row, 'Size'),
+                altitude=AstroPlannerExcelImporter.read_number(row, 'Altitude')
             )
         except ValueError as e:
-            # If conversion fails, raise an error with a descriptive message
-            raise ValueError(f"Error processing row {row['ID']}: {e}")
+            # If conversion fails, raise an error with a descriptive message (the caller reports which row)
+            raise ValueError(f"Could not convert data: {e}")
+
+    @staticmethod
+    def read_number(row, column) -> float:
+        number = float(row[column])
+        if math.isnan(number):
+            # unparseable values are coerced to NaN, which would otherwise silently score as zero or NaN
+            raise ValueError(f"invalid {column}: {row[column]}")
+        return number
 
     @staticmethod
     def normalize_size(size_value):
@@ -1,5 +1,8 @@
+import math
 import unittest
+from unittest.mock import patch
 
+import pandas as pd
 from assertpy import assert_that
 
 from app.utils.astroplanner_excel_importer import AstroPlannerExcelImporter
@@ -19,3 +22,30 @@ class TestAstroPlannerExcelImporter(unittest.TestCase):
     def test_normalize_size_invalid_input(self):
         with self.assertRaises(ValueError):
             AstroPlannerExcelImporter.normalize_size('invalid')
+
+    def test_read_row_as_celestial_object(self):
+        row = pd.Series({'ID': 'M1', 'Type': 'DeepSky', 'Mag': 8.4, 'Size': 6.0, 'Altitude': 50.0})
+        assert_that(AstroPlannerExcelImporter.read_row_as_celestial_object(row).altitude).is_equal_to(50.0)
+
+    def test_read_row_as_celestial_object_invalid_numbers(self):
+        valid_row = {'ID': 'M1', 'Type': 'DeepSky', 'Mag': 8.4, 'Size': 6.0, 'Altitude': 50.0}
+        for column in ['Mag', 'Size', 'Altitude']:
+            for invalid_value in ['invalid', math.nan]:
+                with self.subTest(column=column, value=invalid_value):
+                    row = pd.Series({**valid_row, column: invalid_value})
+                    with self.assertRaises(ValueError):
+                        AstroPlannerExcelImporter.read_row_as_celestial_object(row)
+
+    def test_import_data_skips_unscorable_rows(self):
+        sheet = pd.DataFrame({
+            'ID': ['Jupiter', 'Halley', 'M1'],
+            'Type': ['Planet', 'Comet', 'DeepSky'],
+            'Mag': ['-2,4', '4,0', '8,4'],
+            'Size': ["0.77'", "5'", "6'"],
+            'Altitude': ['43°', '30°', '50°'],
+        })
+
+        with patch('pandas.read_excel', return_value=sheet):
+            celestial_objects = AstroPlannerExcelImporter('sheet.xlsx').import_data()
+
+        assert_that([celestial_object.name for celestial_object in celestial_objects]).is_equal_to(['Jupiter', 'M1'])
@@ -1,20 +1,55 @@
+import math
 import unittest
 
 from assertpy import assert_that
 
-from app.domain.model.celestial_object import CelestialObject
+from app.domain.model.celestial_object import CelestialObject, CelestialObjectScore
 from app.domain.services.observability_calculation_service import ObservabilityCalculationService
 
 
 class TestObservabilityCalculationService(unittest.TestCase):
 
-    def setUp(self):
-        self.service = ObservabilityCalculationService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ObservabilityCalculationService()
 
     def test_calculate_observability(self):
         celestial_object = CelestialObject("Test", "Planet", 1.0, 1.0, 1.0)
         assert_that(self.service.calculate_observability_score(celestial_object)).is_not_none()
 
+    def test_verify_scorable(self):
+        self.service.verify_scorable(CelestialObject('Jupiter', 'Planet', -2.40, 0.77, 43.00))
+
+        with self.assertRaises(ValueError):
+            self.service.verify_scorable(CelestialObject('Halley', 'Comet', 4.0, 5.0, 30.00))
+
+    def test_below_horizon_is_zero(self):
+        below_horizon = CelestialObject('Jupiter Below Horizon', 'Planet', -2.40, 0.77, -10.00)
+
+        assert_that(self.service.calculate_observability_score(below_horizon)).is_equal_to(CelestialObjectScore(0.0, 0.0))
+        assert_that(self.service.calculate_observability_scores([below_horizon])).is_equal_to([CelestialObjectScore(0.0, 0.0)])
+
+        unknown_altitude = CelestialObject('Jupiter Unknown Altitude', 'Planet', -2.40, 0.77, math.nan)
+
+        assert_that(self.service.calculate_observability_score(unknown_altitude)).is_equal_to(CelestialObjectScore(0.0, 0.0))
+        assert_that(self.service.calculate_observability_scores([unknown_altitude])).is_equal_to([CelestialObjectScore(0.0, 0.0)])
+
+    def test_calculate_observability_scores_matches_single_scoring(self):
+        objects = [
+            CelestialObject('Sun', 'Sun', -26.74, 31.00, 39.00),
+            CelestialObject('Jupiter', 'Planet', -2.40, 0.77, 43.00),
+            CelestialObject("Messier 1", "DeepSky", 8.4, 6.0, 50.0),
+            CelestialObject('Andromeda Galaxy', 'DeepSky', 3.44, 190.00, 60.00),
+        ]
+
+        batch_scores = self.service.calculate_observability_scores(objects)
+
+        assert_that(batch_scores).is_length(len(objects))
+        for celestial_object, batch_score in zip(objects, batch_scores):
+            single_score = self.service.calculate_observability_score(celestial_object)
+            assert_that(batch_score.score).is_close_to(single_score.score, 1e-9)
+            assert_that(batch_score.normalized_score).is_close_to(single_score.normalized_score, 1e-9)
+
     def test_relative_scoring_of_celestial_objects(self):
         objects = [
             CelestialObject('Sun', 'Sun', -26.74, 31.00, 39.00),  # Example values
@@ -23,15 +58,13 @@ class TestObservabilityCalculationService(unittest.TestCase):
             CelestialObject("Messier 1", "DeepSky", 8.4, 6.0, 50.0)
         ]
 
-        scored_objects = [(obj.name, self.service.calculate_observability_score(obj).normalized_score) for obj in objects]
-        # Sort by score in descending order
-        scored_objects.sort(key=lambda x: x[1], reverse=True)
+        scores = self.service.calculate_observability_scores(objects)
+        normalized_scores = {obj.name: score.normalized_score for obj, score in zip(objects, scores)}
 
         # Now verify the order - expecting Sun > Moon > Jupiter > Messier 1
         expected_order = ["Sun", "Moon", "Jupiter", "Messier 1"]
-        actual_order = [name for name, _ in scored_objects]
 
-        assert_that(actual_order).is_equal_to(expected_order)
+        self.assert_ranked_in_order(normalized_scores, expected_order)
 
     def test_deep_sky_object_ranking(self):
         objects = [
@@ -43,10 +76,10 @@ class TestObservabilityCalculationService(unittest.TestCase):
         ]
 
         # Calculate scores
-        scored_objects = [(obj.name, self.service.calculate_observability_score(obj).normalized_score) for obj in objects]
-        # Sort by score in descending order (higher score = higher rank)
-        scored_objects.sort(key=lambda x: x[1], reverse=True)
+        scores = self.service.calculate_observability_scores(objects)
+        normalized_scores = {obj.name: score.normalized_score for obj, score in zip(objects, scores)}
 
+        # Higher score = higher rank
         expected_order = [
             "Very Large Bright",
             "Medium Size Medium Bright",
@@ -55,7 +88,10 @@ class TestObservabilityCalculationService(unittest.TestCase):
             "Small Faint"
         ]
 
-        actual_order = [name for name, _ in scored_objects]
+        self.assert_ranked_in_order(normalized_scores, expected_order)
 
-        # Assert that the actual ranking matches the expected ranking
-        assert_that(actual_order).is_equal_to(expected_order)
+    def assert_ranked_in_order(self, normalized_scores, expected_order):
+        # compare each neighbouring pair separately, so a failure names the exact pair that is out of order
+        for higher, lower in zip(expected_order, expected_order[1:]):
+            with self.subTest(pair=(higher, lower)):
+                assert_that(normalized_scores[higher]).is_greater_than(normalized_scores[lower])